@@ -32,7 +32,6 @@ import pickle
 import re
 from scipy import interpolate, stats
 from scipy.ndimage import median_filter
-import sqlalchemy
 import subprocess
 import sys
 repo_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
@@ -48,7 +47,7 @@ import warnings
 
 import _DENA.resource.config as cfg
 from _DENA import DENA_DIR
-from _DENA.resource.helpers import get_deployment, get_logger, query_adsb, query_tracks
+from _DENA.resource.helpers import get_deployment, get_engine, get_logger, query_adsb, query_tracks
 from nps_active_space.utils.computation import coords_to_utm, interpolate_spline
 from nps_active_space.utils.models import Tracks, Adsb
 
@@ -2145,7 +2144,7 @@ class AudibleTransitsGPS(AudibleTransits):
         host = "165.83.50.64"
         port = "5432"
         name = "overflights"
-        engine = sqlalchemy.create_engine(
+        engine = get_engine(
             f'postgresql://{username}:{password}@{host}:{port}/{name}'
         )
         return engine
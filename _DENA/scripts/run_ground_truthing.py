@@ -1,9 +1,10 @@
 import glob
 from argparse import ArgumentParser
+from collections import defaultdict
 
 import geopandas as gpd
 import os
-import sqlalchemy
+import pandas as pd
 import sys
 repo_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
 config_dir = os.path.join(repo_dir, "_DENA")
@@ -18,7 +19,7 @@ from nps_active_space.utils import Nvspl, Tracks
 
 import _DENA.resource.config as cfg
 from _DENA import DENA_DIR
-from _DENA.resource.helpers import get_deployment, get_logger, query_adsb, query_tracks
+from _DENA.resource.helpers import get_deployment, get_engine, get_logger, query_adsb, query_tracks
 from nps_active_space.utils import coords_to_utm
 
 
@@ -41,7 +42,7 @@ if __name__ == '__main__':
 
     cfg.initialize(f"{DENA_DIR}/config", environment=args.environment)
     logger = get_logger('GROUND-TRUTHING')
-    engine = sqlalchemy.create_engine(
+    engine = get_engine(
         'postgresql://{username}:{password}@{host}:{port}/{name}'.format(**cfg.read('database:overflights'))
     )
 
@@ -69,26 +70,28 @@ if __name__ == '__main__':
             mask=study_area
         )
 
-        raw_tracks["local_hourtime"] = raw_tracks["TIME"].apply(lambda t: t.replace(minute=0, second=0, microsecond=0))
+        raw_tracks["local_hourtime"] = raw_tracks["TIME"].dt.floor('H')
         tracks = Tracks(raw_tracks, id_col='flight_id', datetime_col='TIME', z_col='altitude')
-        hourtimes = tracks.local_hourtime.astype(object).unique()
+        hourtimes = pd.DatetimeIndex(tracks.local_hourtime.unique())
 
     elif args.track_source == 'Database':
         raw_tracks = query_tracks(engine=engine, start_date=nvspl_dates[0], end_date=nvspl_dates[-1], mask=study_area)
+        raw_tracks['ak_hourtime'] = pd.to_datetime(raw_tracks['ak_hourtime'])  # Keep as datetime64, not objects.
         tracks = Tracks(raw_tracks, 'flight_id', 'ak_datetime', 'altitude_m')
-        hourtimes = tracks.ak_hourtime.astype(object).unique()
+        hourtimes = pd.DatetimeIndex(tracks.ak_hourtime.unique())
 
     else:
         raise NotImplementedError('Code for AIS is not ready yet.')
 
-    track_hours = [{'year': hourtime.year,
-                    'month': hourtime.month,
-                    'day': hourtime.day,
-                    'hour': hourtime.hour}
-                   for hourtime in hourtimes]
+    # Group the flight hours by day so the archive is walked once per day instead of once per hour.
+    track_hours = defaultdict(set)
+    for year, month, day, hour in zip(hourtimes.year, hourtimes.month, hourtimes.day, hourtimes.hour):
+        track_hours[(year, month, day)].add(hour)
+    track_days = [{'year': year, 'month': month, 'day': day} for year, month, day in track_hours]
 
     # Open NVSPL data files during hours in which there is flight data.
-    nvspl_files = [e.path for e in archive.nvspl(unit=args.unit, site=args.site, year=str(args.year), items=track_hours)]
+    nvspl_files = [e.path for e in archive.nvspl(unit=args.unit, site=args.site, year=str(args.year), items=track_days)
+                   if int(e.hour) in track_hours[(int(e.year), int(e.month), int(e.day))]]
     nvspl = Nvspl(nvspl_files)
 
     logger.info("Launching application...")
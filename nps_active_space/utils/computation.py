@@ -1,14 +1,21 @@
-import datetime as dt
+import functools
 import math
-from typing import Iterable, List, Optional, Tuple, TYPE_CHECKING
+from typing import Iterable, List, Optional, Tuple, TYPE_CHECKING, Union
 
 import geopandas as gpd
 import numpy as np
+import pandas as pd
 import rasterio
 from osgeo import gdal
+from pyproj import Transformer
 from scipy import interpolate
 from shapely.geometry import Point
 
+try:
+    import numba
+except ImportError:  # numba is optional; without it the NumPy implementations of the numeric kernels are used.
+    numba = None
+
 if TYPE_CHECKING:
     from nps_active_space.utils.models import Microphone, Nvspl, Tracks
 
@@ -24,6 +31,7 @@ __all__ = [
     'compute_fbeta',
     'contiguous_regions',
     'coords_to_utm',
+    'coords_to_utm_array',
     'create_overlapping_mesh',
     'interpolate_spline',
     'NMSIM_bbox_utm',
@@ -31,6 +39,12 @@ __all__ = [
 ]
 
 
+@functools.lru_cache(maxsize=32)
+def _get_transformer(crs: str) -> Transformer:
+    """Return a cached WGS84 to `crs` transformer. Building a PROJ pipeline is far slower than using one."""
+    return Transformer.from_crs('epsg:4326', crs, always_xy=True)
+
+
 def NMSIM_bbox_utm(study_area: gpd.GeoDataFrame) -> str:
     """
     NMSIM references an entire project to the westernmost extent of the elevation (or landcover) file.
@@ -83,23 +97,55 @@ def coords_to_utm(lat: float, lon: float) -> str:
     return utm_proj
 
 
+def coords_to_utm_array(lats: Iterable[float], lons: Iterable[float]) -> np.ndarray:
+    """
+    Vectorized version of `coords_to_utm`. Takes the latitudes and longitudes of many points and outputs the EPSG code
+    corresponding to the UTM zone of each point.
+
+    Parameters
+    ----------
+    lats : array-like of floats
+        Latitudes of points in decimal degrees in a geographic coordinate system.
+    lons : array-like of floats
+        Longitudes of points in decimal degrees in a geographic coordinate system.
+
+    Returns
+    -------
+    utm_projs : ndarray of strs
+        UTM zone projection names (e.g.  'epsg:26905' for UTM 5N), one per point.
+    """
+    lats = np.asarray(lats, dtype=np.float64)
+    lons = np.asarray(lons, dtype=np.float64)
+
+    # 6 degrees per zone; add 180 because zone 1 starts at 180 W.
+    utm_zones = ((lons + 180) // 6 + 1).astype(int)
+
+    # 269 = northern hemisphere, 327 = southern hemisphere
+    prefixes = np.where(lats > 0, 'epsg:269', 'epsg:327')
+    utm_projs = np.char.add(prefixes, np.char.zfill(utm_zones.astype(str), 2))
+    return utm_projs
+
+
 def climb_angle(v: Iterable) -> np.ndarray:
     """
     Compute the 'climb angle' of a vector.
     A = 𝑛•𝑏=|𝑛||𝑏|𝑠𝑖𝑛(𝜃)
 
+    With n = [0, 0, 1] the unit normal to the xy plane, this reduces to sin(𝜃) = 𝑏_z / |𝑏|, which is computed as
+    𝜃 = arctan2(𝑏_z, hypot(𝑏_x, 𝑏_y)) so that zero-length vectors give 0 rather than NaN.
+
     Parameters
     ----------
     v : array-like
-        Vector to compute the climb angle for.
+        Vector (3,) or array of vectors (N, 3) to compute the climb angle for.
 
     Returns
     -------
     degrees : ndarray of floats
-        Corresponding climb angle value in degrees.
+        Corresponding climb angle value(s) in degrees.
     """
-    n = np.array([0, 0, 1])  # A unit normal vector perpendicular to the xy plane
-    degrees = np.degrees(np.arcsin(np.dot(n, v) / np.linalg.norm(n) * np.linalg.norm(v)))
+    v = np.asarray(v, dtype=np.float64)
+    degrees = np.degrees(np.arctan2(v[..., 2], np.hypot(v[..., 0], v[..., 1])))
     return degrees
 
 
@@ -130,31 +176,76 @@ def interpolate_spline(points: 'Tracks', ds: int = 1) -> gpd.GeoDataFrame:
     assert points.shape[0] > 1, "A minimum of 2 points is required for calculate a spline."
     k = min(points.shape[0] - 1, 3)
 
-    points.sort_values(by='point_dt', ascending=True, inplace=True)
+    # Tracks are usually already in time order; only pay for a sort when they are not. Sort a copy so the caller's
+    #  GeoDataFrame is not modified.
+    if not points.point_dt.is_monotonic_increasing:
+        points = points.sort_values(by='point_dt', ascending=True, kind='stable')
     starttime = points.point_dt.iat[0]
     endtime = points.point_dt.iat[-1]
     flight_times = (points.point_dt - starttime).dt.total_seconds().values  # Seconds after initial point
 
-    coords = [points.geometry.x, points.geometry.y, points.z] if 'z' in points else [points.geometry.x, points.geometry.y]
-    tck, u = interpolate.splprep(x=coords, u=flight_times, k=k)
+    # Read the x, y coordinate arrays with the vectorized GeoSeries.x/.y accessors (one pass each). z is kept in its
+    #  own column (see Tracks).
+    coords = [points.geometry.x.to_numpy(np.float64), points.geometry.y.to_numpy(np.float64)]
+    if 'z' in points:
+        coords.append(points.z.to_numpy(np.float64))
+    coords = np.column_stack(coords)  # (N, 2) or (N, 3)
+
+    # Fit a parametric smoothing spline with time as the parameter. splprep's default smoothing condition
+    #  (s = m - sqrt(2*m)) is kept on purpose: the spline is not forced through every noisy track point.
+    (t, c, k), u = interpolate.splprep(x=coords.T, u=flight_times, k=k)
 
-    # Parametric interpolation on the time interval provided.
+    # Evaluate all axes of the fitted spline in one vectorized call on the time interval provided. The BSpline holds
+    #  the same knots and coefficients as the splprep fit, so the output matches splev.
+    spline = interpolate.BSpline(t, np.column_stack(c)[:t.size - k - 1], k, axis=0)
     duration = (endtime - starttime).total_seconds()
     tnew = np.arange(0, duration + ds, ds)
-    spl_out = interpolate.splev(tnew, tck)
-    track_spline = gpd.GeoDataFrame({'point_dt': [starttime + dt.timedelta(seconds=offset) for offset in tnew]},
-                                    geometry=[Point(xyz) for xyz in zip(spl_out[0], spl_out[1], spl_out[2])],
-                                    crs=points.crs)
+    spl_out = spline(tnew)  # (M, 2) or (M, 3)
+
+    # Build the output times and geometries in bulk rather than one Python object at a time.
+    z = spl_out[:, 2] if spl_out.shape[1] > 2 else None
+    geometry = gpd.GeoSeries.from_xy(spl_out[:, 0], spl_out[:, 1], z, crs=points.crs)
+    track_spline = gpd.GeoDataFrame({'point_dt': starttime + pd.to_timedelta(tnew, unit='s')},
+                                    geometry=geometry, copy=False)
     return track_spline
 
 
+def _audible_delays(xs: np.ndarray, ys: np.ndarray, tx: float, ty: float,
+                    m1: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Planar distance from each (xs[i], ys[i]) coordinate to the target coordinate (tx, ty), and the number of seconds
+    it takes sound traveling at speed m1 to cover that distance.
+    """
+    distance = np.hypot(xs - tx, ys - ty)
+    return distance, distance / m1
+
+
+if numba is not None:
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _audible_delays(xs: np.ndarray, ys: np.ndarray, tx: float, ty: float,  # noqa: F811
+                        m1: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Planar distance from each (xs[i], ys[i]) coordinate to the target coordinate (tx, ty), and the number of
+        seconds it takes sound traveling at speed m1 to cover that distance. Computed in a single parallel pass.
+        """
+        distance = np.empty(xs.size)
+        delay = np.empty(xs.size)
+        for i in numba.prange(xs.size):
+            dx = xs[i] - tx
+            dy = ys[i] - ty
+            distance[i] = math.sqrt(dx * dx + dy * dy)
+            delay[i] = distance[i] / m1
+        return distance, delay
+
+
 def audible_time_delay(points: gpd.GeoDataFrame, time_col: str, target: Point,
                        m1: float = 343., drop_cols: bool = False) -> gpd.GeoDataFrame:
     """
     Given a set of points and a target location, calculate when a sound made at each point could be heard at
     the target.
 
-    **IMPORTANT**: The points GeoDataFrame and the target Point should be in the same crs for accurate calculations.
+    **IMPORTANT**: The points GeoDataFrame and the target Point should be in the same projected crs for accurate
+    calculations. Distances are computed directly from the x, y coordinates as planar Euclidean distances.
 
     Parameters
     ----------
@@ -176,12 +267,15 @@ def audible_time_delay(points: gpd.GeoDataFrame, time_col: str, target: Point,
     Standard: time_audible
     Optional: distance_to_target, audible_delay_sec
     """
-    points['distance_to_target'] = points.geometry.apply(lambda geom: target.distance(geom))
-    points['audible_delay_sec'] = points['distance_to_target'] / m1
-    points['time_audible'] = points.apply(lambda row: row[time_col] + dt.timedelta(seconds=row.audible_delay_sec), axis=1)
+    # Vectorized distance and delay calculations on raw coordinate arrays; no per-point Python calls.
+    xs, ys = points.geometry.x.to_numpy(np.float64), points.geometry.y.to_numpy(np.float64)
+    distance_to_target, audible_delay_sec = _audible_delays(xs, ys, target.x, target.y, m1)
+    points['time_audible'] = points[time_col] + pd.to_timedelta(audible_delay_sec, unit='s')
 
-    if drop_cols:
-        points.drop(['distance_to_target', 'audible_delay_sec'], inplace=True)
+    # Only materialize the intermediate columns if the caller wants to keep them.
+    if not drop_cols:
+        points['distance_to_target'] = distance_to_target
+        points['audible_delay_sec'] = audible_delay_sec
 
     return points
 
@@ -207,14 +301,14 @@ def build_src_point_mesh(area: gpd.GeoDataFrame, density: int = 48, altitude: Op
     # Start out with a grid of N = density x density points. Polygon bounds:  (minx, miny, maxx, maxy)
     x = np.linspace(area.total_bounds[0], area.total_bounds[2], density)
     y = np.linspace(area.total_bounds[1], area.total_bounds[3], density)
-    x_ind, y_ind = np.meshgrid(x, y)
 
-    # Create an array of mesh points. np.ravel linearly indexes an array into a row.
-    mesh_points = np.array([np.ravel(x_ind), np.ravel(y_ind)]).T
+    # Flattened grid coordinates in the same (row-major, x fastest) order as np.meshgrid + np.ravel, without
+    #  allocating the two intermediate 2-D grids.
+    xs, ys = np.tile(x, y.size), np.repeat(y, x.size)
+    zs = np.full(xs.size, altitude) if altitude else None
 
-    # Convert coordinate tuples into shapely points.
-    mesh_points = [Point(point[0], point[1]) if not altitude
-                   else Point(point[0], point[1], altitude) for point in mesh_points]
+    # Convert the coordinate arrays into shapely points in a single vectorized call.
+    mesh_points = list(gpd.points_from_xy(xs, ys, zs))
 
     return mesh_points
 
@@ -244,20 +338,19 @@ def create_overlapping_mesh(area: gpd.GeoDataFrame, spacing: int = 1,
     minx, miny, maxx, maxy = area_m.total_bounds
     x = np.linspace(minx, maxx, math.ceil((maxx-minx)/(spacing*1000)))
     y = np.linspace(miny, maxy, math.ceil((maxy-miny)/(spacing*1000)))
-    x_ind, y_ind = np.meshgrid(x, y)
 
-    # np.ravel linearly indexes an array into a row.
-    mesh_points = [Point(point[0], point[1]) for point in np.array([np.ravel(x_ind), np.ravel(y_ind)]).T]
-    mesh_points = gpd.GeoDataFrame({'geometry': mesh_points}, geometry='geometry', crs=equal_area_crs)
+    # Flattened grid coordinates in np.meshgrid + np.ravel order, without the intermediate 2-D grids.
+    xs, ys = np.tile(x, y.size), np.repeat(y, x.size)
+    mesh_points = gpd.points_from_xy(xs, ys)
 
-    # Only keep points that fall within the study area.
-    mesh_points = gpd.sjoin(mesh_points, area_m, op='within')[['geometry']]
+    # Only keep points that fall within the study area. The predicate is evaluated as predicate(point, polygon), so
+    #  query_bulk returns (point, polygon) positional index pairs for each point within a study area polygon.
+    hits = area_m.sindex.query_bulk(mesh_points, predicate='within')
+    mesh_points = gpd.GeoDataFrame(geometry=mesh_points[np.unique(hits[0])], crs=equal_area_crs)
 
-    # Create mesh around points.
-    mesh = mesh_points.buffer(mesh_size*1000, cap_style=3)
-
-    mesh.reset_index(drop=True, inplace=True)
-    mesh_points.reset_index(drop=True, inplace=True)
+    # Create mesh around points with a square (cap_style=3) buffer over the whole geometry array at once. Both
+    #  outputs already have a fresh RangeIndex, so no index reset is needed.
+    mesh = gpd.GeoSeries(mesh_points.geometry.values.buffer(mesh_size*1000, cap_style=3), crs=equal_area_crs)
 
     return mesh.to_crs(area.crs), mesh_points.to_crs(area.crs)
 
@@ -278,28 +371,39 @@ def project_raster(input_raster: str, output_raster: str, crs: str):
     gdal.Warp(output_raster, input_raster, dstSRS=crs)
 
 
-def ambience_from_raster(ambience_src: str, mic: 'Microphone') -> float:
+def ambience_from_raster(ambience_src: str,
+                         mic: Union['Microphone', Iterable['Microphone']]) -> Union[float, np.ndarray]:
     """
-    Select the ambience level from a broadband raster at a specific microphone location.
+    Select the ambience level from a broadband raster at one or more microphone locations.
+    The raster is opened once no matter how many microphones are passed, and only the pixels at the microphone
+    locations are read.
 
     Parameters
     ----------
     ambience_src : str
         The absolute file path to a raster of broadband ambience.
-    mic : Microphone
-        A Microphone object whose location to select the broadband ambience for.
+    mic : Microphone or Iterable of Microphones
+        A Microphone object (or several) whose location to select the broadband ambience for.
 
     Returns
     -------
-    Lx : float
-        The ambience level at the microphone location.
+    Lx : float or ndarray of floats
+        The ambience level at the microphone location. An array of levels, one per microphone, if an iterable of
+        microphones was passed.
     """
+    single = not isinstance(mic, Iterable)
+    mics = [mic] if single else list(mic)
+
     with rasterio.open(ambience_src) as raster:
-        projected_mic = mic.to_crs(raster.crs)
-        band1 = raster.read(1)
-        Lx = band1[raster.index(projected_mic.x, projected_mic.y)]
+        # Project all microphone locations at once with a single cached transformer. The raster crs is keyed by its WKT
+        #  so the cache does not depend on rasterio CRS objects being hashable.
+        projection = _get_transformer(raster.crs.to_wkt())
+        xs, ys = projection.transform([m.lon for m in mics], [m.lat for m in mics])
+        # Sample just the band 1 pixels under each microphone instead of reading the whole band into memory.
+        samples = raster.sample(zip(xs, ys), indexes=1)
+        Lx = np.fromiter((sample[0] for sample in samples), dtype=raster.dtypes[0], count=len(mics))
 
-    return Lx
+    return Lx[0] if single else Lx
 
 
 def ambience_from_nvspl(ambience_src: 'Nvspl', quantile: int = 50, broadband: bool = False): # TODO
@@ -318,10 +422,14 @@ def ambience_from_nvspl(ambience_src: 'Nvspl', quantile: int = 50, broadband: bo
     -------
     Lx
     """
+    q = 1 - (quantile / 100)
     if broadband:
-        Lx = ambience_src.loc[:, 'dbA'].quantile(1 - (quantile / 100))
+        Lx = np.nanquantile(ambience_src['dbA'].to_numpy(np.float64), q)
     else:
-        Lx = ambience_src.loc[:, "12.5":"20000"].quantile(1 - (quantile / 100))
+        # Take the 1/3rd octave band columns as one positional block and compute every band's quantile at once.
+        start, stop = ambience_src.columns.get_loc("12.5"), ambience_src.columns.get_loc("20000") + 1
+        bands = ambience_src.iloc[:, start:stop]
+        Lx = pd.Series(np.nanquantile(bands.to_numpy(np.float64), q, axis=0), index=bands.columns)
 
     return Lx
 
@@ -355,24 +463,29 @@ def compute_fbeta(valid_points: gpd.GeoDataFrame, active_space: gpd.GeoDataFrame
     n_tot: int
         number of points annotated.
     """
-    # Before computing anything, make sure projections match:
+    # Before computing anything, make sure projections match. Project the active space (typically a single polygon)
+    #  rather than the (many) annotated points, so the points and their spatial index can be reused as-is across
+    #  calls when sweeping many active spaces.
     if valid_points.crs != active_space.crs:
-        valid_points.to_crs(active_space.crs, inplace=True)
+        active_space = active_space.to_crs(valid_points.crs)
 
-    # iterate through all valid points and check if they are in the active space... this takes a while.
-    in_AS_gdf = gpd.clip(valid_points, active_space)
+    # Flag the points that fall in the active space with a spatial index predicate query. Unlike gpd.clip, this does
+    #  not construct any intersection geometries. query_bulk returns (input geometry, point) positional index pairs.
+    hits = valid_points.sindex.query_bulk(active_space.geometry.values, predicate='intersects')
+    in_AS = np.zeros(len(valid_points), dtype=bool)
+    in_AS[hits[1]] = True
 
     # make an `in_activespace` column and set to true for points inside mask
-    valid_points['in_AS'] = False
-    valid_points.loc[in_AS_gdf.index, 'in_AS'] = True
+    valid_points['in_AS'] = in_AS
 
     in_AS = valid_points.in_AS.values  # convert both of these columns to boolean arrays for easier
     audible = valid_points.audible.values
 
-    # compute true positives, etc.
-    TP = np.all([in_AS, audible], axis=0).sum()
-    FP = np.all([in_AS, ~audible], axis=0).sum()
-    FN = np.all([~in_AS, audible], axis=0).sum()
+    # compute true positives, etc. from a single intersection count.
+    both = np.count_nonzero(in_AS & audible)
+    TP = both
+    FP = np.count_nonzero(in_AS) - both
+    FN = np.count_nonzero(audible) - both
     n_tot = len(valid_points)
 
     precision = TP / (TP + FP)  # specificity... if a flight enters the active space, is it actually audible?
@@ -401,26 +514,60 @@ def contiguous_regions(condition):
     """
 
     # Find the indicies of changes in "condition"
-    d = np.diff(condition)
-    idx, = d.nonzero() 
-
     # We need to start things after the change in "condition". Therefore, 
     # we'll shift the index by 1 to the right.
-    idx += 1
+    changes = np.flatnonzero(np.diff(condition)) + 1
 
-    if condition[0]:
-        # If the start of condition is True prepend a 0
-        idx = np.r_[0, idx]
+    # Allocate the output once, with a slot in front for a 0 and a slot at the end for the length of the array.
+    idx = np.empty(changes.size + 2, dtype=np.intp)
+    idx[0] = 0
+    idx[1:-1] = changes
+    idx[-1] = condition.size
 
-    if condition[-1]:
-        # If the end of condition is True, append the length of the array
-        idx = np.r_[idx, condition.size] # Edit
+    # Keep the leading 0 only if the start of condition is True, and the trailing
+    # length of the array only if the end of condition is True.
+    idx = idx[(0 if condition[0] else 1):(None if condition[-1] else -1)]
 
     # Reshape the result into two columns
-    idx.shape = (-1,2)
+    idx = idx.reshape(-1, 2)
 
     return idx
 
+def _audibility_runs(aud: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find the contiguous True regions and the contiguous False regions of a 1-D boolean array.
+    Both are returned in the same format as `contiguous_regions`.
+    """
+    return contiguous_regions(aud), contiguous_regions(~aud)
+
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _audibility_runs(aud: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:  # noqa: F811
+        """
+        Find the contiguous True regions and the contiguous False regions of a 1-D boolean array.
+        Both are returned in the same format as `contiguous_regions`, from a single scan over the array.
+        """
+        n = aud.size
+        true_runs = np.empty((n // 2 + 1, 2), dtype=np.int64)
+        false_runs = np.empty((n // 2 + 1, 2), dtype=np.int64)
+        n_true = 0
+        n_false = 0
+        start = 0
+        for i in range(1, n + 1):
+            if i == n or aud[i] != aud[start]:
+                if aud[start]:
+                    true_runs[n_true, 0] = start
+                    true_runs[n_true, 1] = i
+                    n_true += 1
+                else:
+                    false_runs[n_false, 0] = start
+                    false_runs[n_false, 1] = i
+                    n_false += 1
+                start = i
+        return true_runs[:n_true], false_runs[:n_false]
+
+
 def audibility_to_interval(aud, invert=False):
 
     '''
@@ -448,43 +595,28 @@ def audibility_to_interval(aud, invert=False):
         A 2-D int array bounding closed noise-free intervals.  
         The first value in the pair is the start index, the second value is the end index.
     '''
-    aud = aud.astype('bool')
+    aud = np.ascontiguousarray(aud, dtype='bool')
     if invert == True:
         aud = np.invert(aud) # invert detection mappings
     
     # compute naiive intervals
-    noise_intervals = contiguous_regions(aud == True)
-    noise_free_intervals_naiive = contiguous_regions(aud == False)
+    noise_intervals, noise_free_intervals_naiive = _audibility_runs(aud)
     
     nfi_starts = noise_free_intervals_naiive.T[0]
     nfi_ends = noise_free_intervals_naiive.T[1]
 
-    # the record begins with noise...
-    if(noise_intervals[0, 0] == 0):
-        # ...the first noise free interval (and thus ALL intervals) 
-        #    need to start one second later
-        nfi_starts = nfi_starts + 1
-    
-    # the record begins with quietude...
-    else:
-        # ...the first noise free interval stays the same, and equals zero
-        # the rest are + 1
-        nfi_starts = nfi_starts + 1
+    # Noise-free intervals start one second after, and end one second before, the neighboring noise events...
+    nfi_starts = nfi_starts + 1
+    nfi_ends = nfi_ends - 1
+
+    # ...unless the record begins with quietude, in which case the first noise free interval stays the same, and
+    #    equals zero...
+    if not aud[0]:
         nfi_starts[0] = 0
 
-    # the record ends with noise...
-    if(noise_intervals[-1, 0] == 0):
-        # ...the last noise free interval (and thus ALL intervals) need to end one second earlier
-        nfi_ends = nfi_ends - 1
-    
-    # the record ends with quietude...
-    else:
-        # ...the last noise free interval stays the same, and equals zero
-        # the rest are - 1
-        save = nfi_ends[-1]
-        print(save)
-        nfi_ends = nfi_ends - 1
-        nfi_ends[-1] = save
+    # ...or the record ends with quietude, in which case the last noise free interval stays the same.
+    if not aud[-1]:
+        nfi_ends[-1] = noise_free_intervals_naiive[-1, 1]
 
     # recompose NFIs using updated, correct values
     noise_free_intervals = np.array([nfi_starts, nfi_ends]).T
@@ -515,19 +647,20 @@ def calculate_duration_summary(noise_intervals):
     '''
 
     # the durations, themselves, are found by differencing (end - begin)
-    duration_list = noise_intervals.T[1] - noise_intervals.T[0]
+    duration_list = noise_intervals[:, 1] - noise_intervals[:, 0]
 
     # mean duration
     mean = np.mean(duration_list)
 
-    # standard deviation duration
-    stdev = np.std(duration_list)
+    # standard deviation duration (reusing the mean rather than letting np.std recompute it)
+    deviation = duration_list - mean
+    stdev = np.sqrt(np.mean(deviation * deviation))
 
-    # median duration
-    median = np.percentile(duration_list, 50)
+    # median duration; np.median uses a partial sort (np.partition) instead of a full sort
+    median = np.median(duration_list)
 
     # median absolute deviation of duration
-    mad = np.percentile(np.absolute(duration_list - median), 50)
+    mad = np.median(np.absolute(duration_list - median))
 
     # combine the results into a single array
     duration_summary = (duration_list, mean, stdev, median, mad)
@@ -1,21 +1,28 @@
 import datetime as dt
+import functools
 import glob
 import pytz
 import re
 import os
 from dataclasses import dataclass, field
-from typing import List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 import geopandas as gpd
 import numpy as np
 import pandas as pd
 pd.options.mode.copy_on_write = True
-from pyproj import Transformer
 from tqdm import tqdm
 from tzwhere import tzwhere
 import concurrent.futures
 from types import GeneratorType
 
+from nps_active_space.utils.computation import _get_transformer
+
+try:
+    import pyogrio
+except ImportError:  # pyogrio is optional; without it annotation files are read through fiona.
+    pyogrio = None
+
 __all__ = [
     'Adsb',
     'Ais',
@@ -27,6 +34,141 @@ __all__ = [
 ]
 
 
+# Value of each ASCII hex digit, indexed by its byte value, for parsing the fixed-width ADS-B validFlags field.
+_HEX_DIGITS = np.zeros(256, dtype=np.uint16)
+_HEX_DIGITS[np.frombuffer(b'0123456789', dtype=np.uint8)] = np.arange(10)
+_HEX_DIGITS[np.frombuffer(b'abcdef', dtype=np.uint8)] = np.arange(10, 16)
+_HEX_DIGITS[np.frombuffer(b'ABCDEF', dtype=np.uint8)] = np.arange(10, 16)
+
+
+def _read_csv(filepath: str, sep: str = ',', usecols: Optional[Union[List[str], Callable[[str], bool]]] = None,
+              dtype: Optional[Dict[str, Any]] = None, index_col: Optional[int] = None,
+              parse_dates: bool = False) -> pd.DataFrame:
+    """
+    Read a delimited file with the multithreaded pyarrow parser, or the C parser if pyarrow is not installed.
+
+    Parameters
+    ----------
+    filepath : str
+        The file to read.
+    sep : str, default ','
+        The field delimiter.
+    usecols : List of strs or callable, default None
+        The columns to read, or a function that is True for the names of columns to read. All columns by default.
+    dtype : Dict, default None
+        Column name to type mapping. Entries for columns that are not read are ignored.
+    index_col : int, default None
+        Position of the column (among those read) to use as the index.
+    parse_dates : bool, default False
+        If True, parse the index as datetimes.
+    """
+    if callable(usecols):
+        usecols = [c for c in pd.read_csv(filepath, sep=sep, nrows=0).columns if usecols(c)]
+    if dtype and usecols is not None:
+        dtype = {c: t for c, t in dtype.items() if c in usecols}
+
+    try:
+        import pyarrow as pa
+        from pyarrow import csv as pv
+    except ImportError:
+        return pd.read_csv(filepath, sep=sep, engine='c', usecols=usecols, dtype=dtype, index_col=index_col,
+                           parse_dates=parse_dates)
+
+    # String columns are typed at parse time. pd.read_csv(engine='pyarrow') only casts after pyarrow has inferred the
+    #  column, so all-digit values such as ICAO address '001234' would already have lost their leading zeros.
+    dtype = dtype or {}
+    convert_options = pv.ConvertOptions(column_types={c: pa.string() for c, t in dtype.items() if t is str},
+                                        include_columns=usecols or [], strings_can_be_null=True)
+    df = pv.read_csv(filepath, parse_options=pv.ParseOptions(delimiter=sep),
+                     convert_options=convert_options).to_pandas()
+    df = df.astype({c: t for c, t in dtype.items() if t is not str and c in df.columns})
+
+    if index_col is not None:
+        df = df.set_index(df.columns[index_col])
+        if parse_dates:
+            df.index = pd.to_datetime(df.index)
+
+    return df
+
+
+def _flight_ids(df: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Label ADS-B waypoints with a flight_id of the form <ICAO_address>_<flight number>_<DATE>.
+
+    Parameters
+    ----------
+    df : pd.DataFrame
+        ADS-B waypoints with ICAO_address, cumsum (the per-aircraft flight number), and DATE columns. DATE can be
+        YYYYMMDD strings or midnight datetimes, which are formatted once per flight.
+
+    Returns
+    -------
+    codes : np.ndarray
+        An integer code per waypoint identifying its flight.
+    flight_ids : np.ndarray
+        The flight_id string of each waypoint. Strings are only built once per flight rather than once per waypoint.
+    """
+    # ngroup codes index into the group keys, so only the unique (ICAO_address, cumsum, DATE) keys are materialized.
+    flight_groups = df.groupby(['ICAO_address', 'cumsum', 'DATE'], observed=True, sort=False)
+    codes = flight_groups.ngroup().to_numpy()
+    flights = flight_groups.size().index
+    dates = flights.get_level_values(2)
+    dates = dates.strftime("%Y%m%d") if isinstance(dates, pd.DatetimeIndex) else dates.astype(str)
+    labels = flights.get_level_values(0).astype(str) + "_" + flights.get_level_values(1).astype(str) + "_" + dates
+    return codes, np.asarray(labels, dtype=object)[codes]
+
+
+def _segment_flights(frames: List[pd.DataFrame], drop_duplicate_waypoints: bool) -> gpd.GeoDataFrame:
+    """
+    Concatenate cleaned ADS-B waypoints from every file and split them into flights.
+
+    Parameters
+    ----------
+    frames : List of pd.DataFrames
+        Cleaned waypoints from each ADS-B file with ICAO_address, TIME, DATE, lat, and lon columns.
+    drop_duplicate_waypoints : bool
+        If True, identical waypoints (same ICAO_address, TIME, lat, and lon) are removed before flights are split.
+
+    Returns
+    -------
+    gpd.GeoDataFrame of waypoints in epsg:4326 with added dur_secs, diff_flight, cumsum, and flight_id columns.
+        Flights with a single waypoint are removed.
+    """
+    # Concatenate all files once rather than re-copying the accumulated data for every file.
+    data = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+
+    # Sort records by ICAO Address and TIME once across all files so flights spanning files stay continuous.
+    # ICAO addresses repeat for every waypoint; categorical codes make the per-aircraft groupbys integer keyed.
+    data["ICAO_address"] = data["ICAO_address"].astype("category")
+    data.sort_values(["ICAO_address", "TIME"], inplace=True, ignore_index=True)
+
+    # Count then delete any identical waypoints based on ICAO_address, time, lat, and lon. This must happen
+    #  before the durations are computed: otherwise a dropped copy can carry the gap that starts a new flight.
+    if drop_duplicate_waypoints:
+        duplicates = data.duplicated(subset=['ICAO_address', 'TIME', 'lat', 'lon'], keep='last')
+        duplicateWaypoints = duplicates.mean() * 100
+        data = data.loc[~duplicates]
+
+    # Calculate time difference between sequential waypoints for each aircraft
+    data["dur_secs"] = data.groupby("ICAO_address", observed=True)["TIME"].diff().dt.total_seconds()
+    data["dur_secs"] = data["dur_secs"].fillna(0)
+
+    # Use threshold waypoint duration value to identify separate flights by an aircraft then sum the number of "true" conditions to assign unique ID's
+    data['diff_flight'] = data['dur_secs'] >= 900
+    data['cumsum'] = data.groupby('ICAO_address', observed=True)['diff_flight'].cumsum()
+    flight_codes, data['flight_id'] = _flight_ids(data)
+
+    # Remove records where there is only one recorded waypoint for an aircraft
+    data = data[np.bincount(flight_codes)[flight_codes] > 1]
+    data["ICAO_address"] = data["ICAO_address"].astype(str)
+
+    return gpd.GeoDataFrame(
+        data,
+        geometry=gpd.points_from_xy(data["lon"], data["lat"]),
+        crs="epsg:4326"
+    )
+
+
 @dataclass
 class Microphone:
     """
@@ -82,7 +224,7 @@ class Microphone:
             If True, crs will be updated and no instance will be returned.
             If False, crs will be updated an the updated instance will be returned.
         """
-        projection = Transformer.from_crs('epsg:4326', crs, always_xy=True)
+        projection = _get_transformer(crs)
         self.x, self.y = projection.transform(self.lon, self.lat)
         self.crs = crs
         if not inplace:
@@ -110,42 +252,49 @@ class Nvspl(pd.DataFrame):
 
     octave_regex = re.compile(r"^H[0-9]+$|^H[0-9]+p[0-9]$")
 
+    octave_fields = (
+        'H12p5', 'H15p8', 'H20', 'H25', 'H31p5', 'H40', 'H50', 'H63', 'H80', 'H100',
+        'H125', 'H160', 'H200', 'H250', 'H315', 'H400', 'H500', 'H630', 'H800', 'H1000',
+        'H1250', 'H1600', 'H2000', 'H2500', 'H3150', 'H4000', 'H5000', 'H6300', 'H8000',
+        'H10000', 'H12500', 'H16000', 'H20000'
+    )
+
+    # Column types to parse NVSPL files with so pandas does not need to infer them. The C parser reads "-Infinity"
+    #  values as floats.
+    _read_dtypes = {
+        'SiteID': str,
+        **dict.fromkeys(octave_fields + ('dbA', 'dbC', 'dbF', 'Voltage', 'WindSpeed', 'WindDir',
+                                         'TempIns', 'TempOut', 'Humidity'), 'float32')
+    }
+
     def __init__(self, filepaths_or_data: Union[List[str], str, pd.DataFrame]):
         data = self._read(filepaths_or_data)
         super().__init__(data=data)
 
+    def _use_column(self, column: str) -> bool:
+        """Only standard NVSPL columns, the timestamp, and octave band columns are read from NVSPL files."""
+        return column in self.standard_fields or column == 'STime' or self.octave_regex.match(column) is not None
+
+    @staticmethod
+    @functools.lru_cache(maxsize=16)
+    def _octave_rename(columns: Tuple[str, ...]) -> Dict[str, str]:
+        """Map raw octave band column names (e.g. H12p5) to their frequencies (e.g. 12.5). Cached per header."""
+        return {c: c.replace('H', '').replace('p', '.') for c in columns if Nvspl.octave_regex.match(c)}
 
     def parseNvspl(self, nvsplFileEntry, state= (None, None, 1)):
 
         timestamps, columns, index_index = state
 
-        df = pd.read_csv(str(nvsplFileEntry),
-                        engine= 'c',
+        df = _read_csv(str(nvsplFileEntry),
                         parse_dates= True,
                         index_col= index_index,
-                        usecols= columns
+                        usecols= columns if columns is not None else self._use_column,
+                        dtype= self._read_dtypes
                         )
 
         # Make column names slightly nicer
         df.index.name = "date"
-        renamedColumns = { column: column.replace('H', '').replace('p', '.') for column in df.columns if re.match(r"H\d+p?\d*", column) is not None }
-        df.rename(columns= renamedColumns, inplace= True)
-
-        # Coerce numeric columns to floats, in case of "-Infinity" values
-        try:
-            numericCols = [
-                '12.5', '15.8', '20', '25', '31.5', '40', '50', '63', '80', '100',
-                '125', '160', '200', '250', '315', '400', '500', '630', '800', '1000',
-                '1250', '1600', '2000', '2500', '3150', '4000', '5000', '6300', '8000',
-                '10000', '12500', '16000', '20000', 'dbA', 'dbC', 'dbF',
-                'Voltage','WindSpeed', 'WindDir', 'TempIns', 'TempOut', 'Humidity'
-            ]
-            presentNumericCols = df.columns.intersection(numericCols)
-            if len(presentNumericCols) > 0:
-                df[presentNumericCols].astype('float32', copy= False, errors= 'ignore')
-
-        except KeyError:
-            pass
+        df.rename(columns= self._octave_rename(tuple(df.columns)), inplace= True)
 
         self._validate(df, False)
         return df
@@ -154,8 +303,6 @@ class Nvspl(pd.DataFrame):
         """
         Read in and validate the NVSPL data.
 
-        # TODO: for speed and memory improvements, use usecols, define datatypes, and drop empty columns.
-
         Parameters
         ----------
         filepaths_or_data : List, str, or pd.DataFrame
@@ -166,7 +313,7 @@ class Nvspl(pd.DataFrame):
         AssertionError if directory path or file path does not exists or is of the wrong format.
         """
         if isinstance(filepaths_or_data, pd.DataFrame):
-            self._validate(filepaths_or_data.columns)
+            self._validate(filepaths_or_data.columns, False)
             data = filepaths_or_data
 
         else:
@@ -188,8 +335,7 @@ class Nvspl(pd.DataFrame):
 
             data = pd.concat(parts)
 
-        octave_columns = {c: c.replace('H', '').replace('p', '.') for c in filter(self.octave_regex.match, data.columns)}
-        data.rename(columns=octave_columns, inplace=True)
+        data.rename(columns=self._octave_rename(tuple(data.columns)), inplace=True)
 
         # we deliberately sort the DatetimeIndex to ensure it is monotonic
         # this avoids a `KeyError` when selecting using position report timestamps later on
@@ -197,7 +343,7 @@ class Nvspl(pd.DataFrame):
 
         return data
 
-    def _validate(self, columns: List[str], verifyNonStandardOctave):
+    def _validate(self, columns: List[str], verifyNonStandardOctave: bool):
         """
         Ensure that the provided data has only the standard
 
@@ -205,19 +351,22 @@ class Nvspl(pd.DataFrame):
         ----------
         columns : List of strs
             List of NVSPL DataFrame columns.
+        verifyNonStandardOctave : bool
+            If True, also verify that every non-standard column is an octave band column.
 
         Raises
         ------
         AssertionError if any standard column is missing or if any non-standard and non-octave column is present.
         """
         # Verify that all NVSPL standard columns exist.
-        missing_standard_cols = self.standard_fields - set(columns)
+        columns = set(columns)
+        missing_standard_cols = self.standard_fields - columns
         assert missing_standard_cols == set(), f"Missing the following standard NVSPL columns: {missing_standard_cols}"
 
         # Verify all non-standard columns are octave columns. Use verifyNonStandardOctave=False to allow extra columns
         if verifyNonStandardOctave:
-            only_standard_cols = all(re.match(self.octave_regex, col) for col in (set(columns) - self.standard_fields))
-            assert only_standard_cols is True, "NVSPL data contains unexpected NVSPL columns."
+            unexpected_cols = [col for col in columns - self.standard_fields if not self.octave_regex.match(col)]
+            assert not unexpected_cols, f"NVSPL data contains unexpected NVSPL columns: {unexpected_cols}"
 
 
 class Ais(gpd.GeoDataFrame):
@@ -381,7 +530,7 @@ class Ais(gpd.GeoDataFrame):
             df['event_id'] = df['MMSI'].astype('str') + "_" + df['cumsum'].astype(str) + "_" + df['DATE'].astype(str)
 
             # Let us only consider events with more than 2 AIS points
-            df = df[df.groupby("event_id").event_id.transform(len) > 2]
+            df = df[df.groupby("event_id").event_id.transform("size") > 2]
 
             return df
 
@@ -433,11 +582,98 @@ class Adsb(gpd.GeoDataFrame):
         A directory containing ADS-B TSV files, a list of ADS-B TSV files, or an existing gpd.GeoDataFrame of ADS-B data.
     """
 
+    # Extra columns collected by the ADS-B logger that are never used.
+    unused_fields = {
+        'squawk', 'altitude_type', 'alt_type', 'altType', 'callsign', 'emitter_type', 'emitterType'
+    }
+
+    # Hex fields must be read as strings so values such as '100' are not parsed as integers. Numeric fields are left
+    #  to be converted after cleaning because files can contain repeated header rows and '-' placeholders.
+    _read_dtypes = {'ICAO_address': str, 'validFlags': str, 'valid_flags': str}
+
     def __init__(self, filepaths_or_data: Union[List[str], str, gpd.GeoDataFrame]):
         data = self._read(filepaths_or_data)
         data.drop_duplicates(subset=['TIME'], inplace=True, keep = 'last')
         super().__init__(data=data)
 
+    def parseAdsb(self, adsbFileEntry) -> pd.DataFrame:
+        """Read, clean, and filter the waypoints of a single ADS-B file."""
+        df = _read_csv(str(adsbFileEntry), sep="\t", usecols=lambda c: c not in self.unused_fields,
+                       dtype=self._read_dtypes)
+
+        if "TIME" not in df.columns and "timestamp" not in df.columns:
+            raise KeyError(f"{adsbFileEntry} has no TIME or timestamp column.")
+
+        # Loggers that restart mid-file repeat the header row, which is the only way the first column is read as
+        #  strings. Only scan for those rows when that happens.
+        if not pd.api.types.is_numeric_dtype(df.iloc[:, 0]):
+            df = df[~df.iloc[:, 0].isin(["TIME", "timestamp"])]
+
+        # Standardize key field names. Extra columns collected by the ADS-B df logger are skipped at read time.
+        if "timestamp" in df.columns:
+            df = df.rename(columns={"timestamp":"TIME"})
+        if "valid_flags" in df.columns:
+            df = df.rename(columns={"valid_flags":"validFlags"})
+
+        # Delete NA records
+        df.dropna(how="any", axis=0, inplace=True)
+
+        # Unpack validFLags and convert the 2-byte flag field into a list of Boolean values
+        flags_names = ["valid_BARO", "valid_VERTICAL_VELOCITY", "SIMULATED_REPORT", "valid_IDENT",
+                    "valid_CALLSIGN", "valid_VELOCITY", "valid_HEADING", "valid_ALTITUDE", "valid_LATLON"]
+        # validFlags is at most 4 hex digits, so each value is looked up digit by digit as 4 ASCII bytes.
+        flag_digits = (df["validFlags"].str.zfill(4).str[-4:].to_numpy().astype("S4")
+                       .view(np.uint8).reshape(-1, 4))
+        flag_bits = ((_HEX_DIGITS[flag_digits[:, 0]] << 12) | (_HEX_DIGITS[flag_digits[:, 1]] << 8) |
+                     (_HEX_DIGITS[flag_digits[:, 2]] << 4) | _HEX_DIGITS[flag_digits[:, 3]])
+        for i, name in enumerate(reversed(flags_names)):
+            df[name] = ((flag_bits >> i) & 1).astype(bool)
+        df.drop("validFlags", axis=1, inplace=True)
+
+        # Measure how many records have invalid latlon and altitude values based on validFlags
+        if df["valid_LATLON"].sum() == len(df.index):
+            invalidLatLon = 0
+        else:
+            invalidLatLon = round(100 - df["valid_LATLON"].sum() / len(df.index) * 100, 2)
+        if df["valid_ALTITUDE"].sum() == len(df.index):
+            invalidAltitude = 0
+        else:
+            invalidAltitude = round(100 - df["valid_ALTITUDE"].sum() / len(df.index) * 100, 2)
+
+        # Ensure remaining field values except TIME are in proper numeric format
+        df.replace('-', np.NaN, inplace=True)
+        df.dropna(how="any", axis=0, inplace=True)
+        df["ICAO_address"] = df["ICAO_address"].astype(str)
+        # Raw values are integers scaled by at most 1e7, so they all fit in 32 bits (e.g. lon -150 * 1e7).
+        df["lat"] = df["lat"].astype(np.int32)
+        df["lon"] = df["lon"].astype(np.int32)
+        df["altitude"] = df["altitude"].astype(np.int32)
+        df["heading"] = df["heading"].astype(np.int32)
+        df["hor_velocity"] = df["hor_velocity"].astype(np.int32)
+        df["ver_velocity"] = df["ver_velocity"].astype(np.int32)
+        df["tslc"] = df["tslc"].astype(np.int32)
+
+        # Convert Unix timestamp to datetime objects in UTC and re-scale selected variable values
+        # Positions stay float64: float32 only resolves ~1e-5 degrees (about a meter) at these longitudes.
+        df["TIME"] = pd.to_datetime(df["TIME"], unit = "s")
+        df["DATE"] = df["TIME"].dt.normalize()
+        df["lat"] = df["lat"] / 1e7
+        df["lon"] = df["lon"] / 1e7
+        df["altitude"] = (df["altitude"] / 1e3).astype(np.float32)
+        df["heading"] = (df["heading"] / 1e2).astype(np.float32)
+        df["hor_velocity"] = (df["hor_velocity"] / 1e2).astype(np.float32)
+        df["ver_velocity"] = (df["ver_velocity"] / 1e2).astype(np.float32)
+
+        # Keep only those records with valid latlon and altitude values based on validFlags, TSLC values of 1 or 2
+        #  seconds, and realistic altitudes, filtering with a single combined mask.
+        # 10000 meters = 32808 feet; this should encompass most flights
+        # NOTE: some jet aircraft may be eliminated by this process
+        valid_flags = df["valid_LATLON"] & df["valid_ALTITUDE"]
+        valid_tslc = (df["tslc"] < 3) & (df["tslc"] != 0)
+        invalidTslc = (~valid_tslc[valid_flags]).mean() * 100
+        df = df.loc[valid_flags & valid_tslc & (df["altitude"] > 0) & (df["altitude"] <= 10000)]
+        return df
+
     def _read(self, filepaths_or_data: Union[List[str], str, gpd.GeoDataFrame]):
         """
         Read in ADS-B points as formatted by NPS data loggers.
@@ -464,111 +700,12 @@ class Adsb(gpd.GeoDataFrame):
                     assert os.path.isfile(file), f"{file} does not exist."
                     assert (file.endswith('.txt')|file.endswith('.TSV')), f"Only .TSV ADS-B files accepted."
 
-            data = pd.DataFrame()
-            for file in tqdm(filepaths_or_data, desc='Loading ADS-B files', unit='files', colour='green'):
-                df = pd.read_csv(file, sep="\t")
-
-                mask = df.iloc[:, 0].isin(["TIME", "timestamp"])
-                df = df[~mask]
-                header_list = ["TIME", "timestamp"]
-                import_header = df.axes[1]
-                result = any(elem in import_header for elem in header_list)
-                if result:
-                    pass
-                else:
-                    raise KeyError
-
-                # Standardize key field names and remove extra columns collected by the ADS-B df logger
-                if "timestamp" in df.columns:
-                    df = df.rename(columns={"timestamp":"TIME"})
-                if "valid_flags" in df.columns:
-                    df = df.rename(columns={"valid_flags":"validFlags"})
-                df.drop(["squawk", "altitude_type", "alt_type", "altType", "callsign",
-                    "emitter_type", "emitterType"], axis=1, inplace=True, errors="ignore")
-
-                # Delete duplicate and NA records
-                df.drop_duplicates(inplace=True)
-                df.dropna(how="any", axis=0, inplace=True)
-
-                # Unpack validFLags and convert the 2-byte flag field into a list of Boolean values
-                flags_names = ["valid_BARO", "valid_VERTICAL_VELOCITY", "SIMULATED_REPORT", "valid_IDENT",
-                            "valid_CALLSIGN", "valid_VELOCITY", "valid_HEADING", "valid_ALTITUDE", "valid_LATLON"]
-                flags = df["validFlags"].apply(lambda t: list(bin(int(t, 16))[2:].zfill(9)[-9:]))
-                flags_df = pd.DataFrame(list(flags), columns=flags_names).replace({'0': False, '1': True})
-                df = pd.concat([df.drop("validFlags", axis=1), flags_df], axis=1)
-
-                # Keep only those records with valid latlon and altitude values based on validFlags
-                df.dropna(how="any", axis=0, inplace=True)
-                if df["valid_LATLON"].sum() == len(df.index):
-                    invalidLatLon = 0
-                else:
-                    invalidLatLon = round(100 - df["valid_LATLON"].sum() / len(df.index) * 100, 2)
-                if df["valid_ALTITUDE"].sum() == len(df.index):
-                    invalidAltitude = 0
-                else:
-                    invalidAltitude = round(100 - df["valid_ALTITUDE"].sum() / len(df.index) * 100, 2)
-                df.drop(df[df["valid_LATLON"] == "False"].index, inplace = True)
-                df.drop(df[df["valid_ALTITUDE"] == "False"].index, inplace = True)
-
-                # Ensure remaining field values except TIME are in proper numeric format
-                df.replace('-', np.NaN, inplace=True)
-                df.dropna(how="any", axis=0, inplace=True)
-                df["ICAO_address"] = df["ICAO_address"].astype(str)
-                df["lat"] = df["lat"].astype(int)
-                df["lon"] = df["lon"].astype(int)
-                df["altitude"] = df["altitude"].astype(int)
-                df["heading"] = df["heading"].astype(int)
-                df["hor_velocity"] = df["hor_velocity"].astype(int)
-                df["ver_velocity"] = df["ver_velocity"].astype(int)
-                df["tslc"] = df["tslc"].astype(int)
-
-                # Convert Unix timestamp to datetime objects in UTC and re-scale selected variable values
-                df["TIME"] = pd.to_datetime(df["TIME"], unit = "s")
-                df["DATE"] = df["TIME"].dt.strftime("%Y%m%d")
-                df["lat"] = df["lat"] / 1e7
-                df["lon"] = df["lon"] / 1e7
-                df["altitude"] = df["altitude"] / 1e3
-                df["heading"] = df["heading"] / 1e2
-                df["hor_velocity"] = df["hor_velocity"] / 1e2
-                df["ver_velocity"] = df["ver_velocity"] / 1e2
-
-                # Keep only those records with TSLC values of 1 or 2 seconds
-                invalidTslc = len(df.query("tslc >= 3 or tslc == 0")) / df.shape[0] * 100
-                df.drop(df[df["tslc"] >= 3].index, inplace = True)
-                df.drop(df[df["tslc"] == 0].index, inplace = True)
-
-                # Keep only those records with realistic altitudes
-                # 10000 meters = 32808 feet; this should encompass most flights
-                # NOTE: some jet aircraft may be eliminated by this process
-                df = df.loc[(df["altitude"] > 0)&(df["altitude"] <= 10000), :] 
-
-                # Sort records by ICAO Address and TIME then reset dfframe index
-                df.sort_values(["ICAO_address", "TIME"], inplace=True, ignore_index=True)
-
-                # Calculate time difference between sequential waypoints for each aircraft
-                df["dur_secs"] = df.groupby("ICAO_address")["TIME"].diff().dt.total_seconds()
-                df["dur_secs"] = df["dur_secs"].fillna(0)
-
-                # Count then delete any identical waypoints in a single input file based on ICAO_address, time, lat, and lon
-                duplicateWaypoints = 100 - (len(df.drop_duplicates(subset=['ICAO_address', 'TIME', 'lat', 'lon'])) / len(df) * 100)
-                df.drop_duplicates(subset=['ICAO_address', 'TIME', 'lat', 'lon'], keep = 'last')
-
-                # Use threshold waypoint duration value to identify separate flights by an aircraft then sum the number of "true" conditions to assign unique ID's
-                df['diff_flight'] = df['dur_secs'] >= 900
-                df['cumsum'] = df.groupby('ICAO_address')['diff_flight'].cumsum()
-                df['flight_id'] = df['ICAO_address'] + "_" + df['cumsum'].astype(str) + "_" + df['DATE']
-
-                # Remove records where there is only one recorded waypoint for an aircraft and fields that are no longer needed
-                df = df[df.groupby("flight_id").flight_id.transform(len) > 1]
-                df = df.drop(columns = ['tslc', 'dur_secs', 'diff_flight', 'cumsum', 'valid_BARO', 'valid_VERTICAL_VELOCITY', 'SIMULATED_REPORT', 'valid_IDENT', 'valid_CALLSIGN', 'valid_VELOCITY', 'valid_HEADING', 'valid_ALTITUDE', 'valid_LATLON', 'DATE'])
-
-                data = pd.concat([data, df], ignore_index=True)
+            with concurrent.futures.ThreadPoolExecutor() as pool:
+                frames = list(tqdm(pool.map(self.parseAdsb, filepaths_or_data), total=len(filepaths_or_data),
+                                   desc='Loading ADS-B files', unit='files', colour='green'))
 
-            data = gpd.GeoDataFrame(
-                data,
-                geometry=gpd.points_from_xy(data["lon"], data["lat"]),
-                crs="epsg:4326"
-            )
+            data = _segment_flights(frames, drop_duplicate_waypoints=True)
+            data = data.drop(columns = ['tslc', 'dur_secs', 'diff_flight', 'cumsum', 'valid_BARO', 'valid_VERTICAL_VELOCITY', 'SIMULATED_REPORT', 'valid_IDENT', 'valid_CALLSIGN', 'valid_VELOCITY', 'valid_HEADING', 'valid_ALTITUDE', 'valid_LATLON', 'DATE'])
 
         return data
 
@@ -588,6 +725,25 @@ class EarlyAdsb(gpd.GeoDataFrame):
         data.drop_duplicates(subset=['TIME'], inplace=True, keep='last')
         super().__init__(data=data)
 
+    def parseEarlyAdsb(self, adsbFileEntry) -> pd.DataFrame:
+        """Read and filter the waypoints of a single early-logger ADS-B file."""
+        df = _read_csv(str(adsbFileEntry), sep="\t")
+
+        df.columns = ["ICAO_address", "TIME", "lat", "lon", "altitude"]
+        df["ICAO_address"] = df["ICAO_address"].astype(str)
+        df["TIME"] = pd.to_datetime(df["TIME"], format="%Y/%m/%d %H:%M:%S.%f", cache=True).dt.floor("s")
+        df["DATE"] = df["TIME"].dt.strftime("%Y%m%d")
+
+        # unlike later loggers, EarlyAdsb was collected in feet MSL
+        # we need to convert altitude from feet to meters!
+        df["altitude"] = 0.3048*df["altitude"]
+
+        # Keep only those records with realistic altitudes
+        # 10000 meters = 32808 feet; this should encompass most flights
+        # NOTE: some jet aircraft may be eliminated by this process
+        df = df.loc[(df["altitude"] > 0)&(df["altitude"] <= 10000), :] 
+        return df
+
     def _read(self, filepaths_or_data: Union[List[str], str, gpd.GeoDataFrame]):
         """
         Read in ADS-B points as formatted by early-development NPS data loggers (circa 2019).
@@ -614,46 +770,11 @@ class EarlyAdsb(gpd.GeoDataFrame):
                     assert os.path.isfile(file), f"{file} does not exist."
                     assert (file.endswith('.txt')), f"Only .txt ADS-B files accepted."
 
-            data = pd.DataFrame()
-            for file in tqdm(filepaths_or_data, desc='Loading ADS-B files', unit='files', colour='green'):
-                df = pd.read_csv(file, sep="\t")
-
-                df.columns = ["ICAO_address", "TIME", "lat", "lon", "altitude"]
-                df["TIME"] = df["TIME"].apply(lambda t: dt.datetime.strptime(t, "%Y/%m/%d %H:%M:%S.%f").replace(microsecond=0))
-                df["DATE"] = df["TIME"].dt.strftime("%Y%m%d")
-                
-                # unlike later loggers, EarlyAdsb was collected in feet MSL
-                # we need to convert altitude from feet to meters!
-                df["altitude"] = 0.3048*df["altitude"]
-
-                # Keep only those records with realistic altitudes
-                # 10000 meters = 32808 feet; this should encompass most flights
-                # NOTE: some jet aircraft may be eliminated by this process
-                df = df.loc[(df["altitude"] > 0)&(df["altitude"] <= 10000), :] 
-
-                # Sort records by ICAO Address and TIME then reset dataframe index
-                df.sort_values(["ICAO_address", "TIME"], inplace=True, ignore_index=True)
-
-                # Calculate time difference between sequential waypoints for each aircraft
-                df["dur_secs"] = df.groupby("ICAO_address")["TIME"].diff().dt.total_seconds()
-                df["dur_secs"] = df["dur_secs"].fillna(0)
-
-                # Use threshold waypoint duration value to identify separate flights by an aircraft
-                # then sum the number of "true" conditions to assign unique ID's
-                df['diff_flight'] = df['dur_secs'] >= 900
-                df['cumsum'] = df.groupby('ICAO_address')['diff_flight'].cumsum()
-                df['flight_id'] = df['ICAO_address'] + "_" + df['cumsum'].astype(str) + "_" + df['DATE']
-
-                # Remove records where there is only one recorded waypoint for an aircraft
-                df = df[df.groupby("flight_id").flight_id.transform(len) > 1]
+            with concurrent.futures.ThreadPoolExecutor() as pool:
+                frames = list(tqdm(pool.map(self.parseEarlyAdsb, filepaths_or_data), total=len(filepaths_or_data),
+                                   desc='Loading ADS-B files', unit='files', colour='green'))
 
-                data = pd.concat([data, df], ignore_index=True)
-
-            data = gpd.GeoDataFrame(
-                data,
-                geometry=gpd.points_from_xy(data["lon"], data["lat"]),
-                crs="epsg:4326"
-            )
+            data = _segment_flights(frames, drop_duplicate_waypoints=False)
 
         return data
 
@@ -694,6 +815,33 @@ class Tracks(gpd.GeoDataFrame):
         data.sort_values(by=['track_id', 'point_dt'], ascending=True, inplace=True)
         super().__init__(data=data)
 
+    def to_crs_bulk(self, crs: str, inplace: bool = False) -> Optional[gpd.GeoDataFrame]:
+        """
+        Project WGS84 (epsg:4326) track points to a new coordinate system with a single vectorized transform.
+
+        Unlike to_crs(), the PROJ transformer is cached and reused across calls to the same crs.
+
+        Parameters
+        ----------
+        crs : str
+            The coordinate system to project the track points to.
+                Format: epsg:XXXX. E.g. epsg:26906
+        inplace : bool, default False
+            If True, the track points will be projected in place and nothing will be returned.
+            If False, a projected copy of the track points will be returned.
+
+        Raises
+        ------
+        AssertionError if the track points are not in WGS84 (epsg:4326).
+        """
+        assert self.crs == 'epsg:4326', "to_crs_bulk() only projects track points from epsg:4326."
+
+        x, y = _get_transformer(crs).transform(self.geometry.x.to_numpy(), self.geometry.y.to_numpy())
+        data = self if inplace else self.copy()
+        data.set_geometry(gpd.points_from_xy(x, y), crs=crs, inplace=True)
+        if not inplace:
+            return data
+
 
 class Annotations(gpd.GeoDataFrame):
     """
@@ -710,7 +858,10 @@ class Annotations(gpd.GeoDataFrame):
     def __init__(self, filename: Optional[str] = None, only_valid: bool = False):
 
         if filename:
-            data = gpd.read_file(filename).astype({'start_dt': 'datetime64[ns]', 'end_dt': 'datetime64[ns]'})
+            # pyogrio reads all features in one vectorized GDAL call instead of fiona's feature-by-feature iteration.
+            data = pyogrio.read_dataframe(filename) if pyogrio is not None else gpd.read_file(filename)
+            data = data.astype({col: 'datetime64[ns]' for col in ('start_dt', 'end_dt')
+                                if not pd.api.types.is_datetime64_any_dtype(data[col])})
 
             # Sometimes the annotation file is read in with the valid and audible columns as booleans and other times
             #  as objects depending on what values are stored.
@@ -0,0 +1,27 @@
+import sys
+
+import pytest
+
+from nps_active_space.utils.models import _read_csv
+
+
+@pytest.fixture
+def adsb_file(tmp_path):
+    """An ADS-B style TSV whose ICAO addresses are all digits with leading zeros."""
+    path = tmp_path / 'adsb.TSV'
+    path.write_text("ICAO_address\tTIME\tvalidFlags\n"
+                    "001234\t1650000000\t01ff\n"
+                    "000777\t1650000001\t0100\n")
+    return str(path)
+
+
+def test_read_csv_keeps_zero_padded_icao(adsb_file):
+    df = _read_csv(adsb_file, sep='\t', dtype={'ICAO_address': str, 'validFlags': str})
+    assert df['ICAO_address'].tolist() == ['001234', '000777']
+    assert df['validFlags'].tolist() == ['01ff', '0100']
+
+
+def test_read_csv_keeps_zero_padded_icao_without_pyarrow(adsb_file, monkeypatch):
+    monkeypatch.setitem(sys.modules, 'pyarrow', None)
+    df = _read_csv(adsb_file, sep='\t', dtype={'ICAO_address': str, 'validFlags': str})
+    assert df['ICAO_address'].tolist() == ['001234', '000777']